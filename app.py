@@ -1,33 +1,49 @@
+import locale
+
+import numpy as np
 import streamlit as st
 import pandas as pd
 import plotly.express as px
+import plotly.graph_objects as go
+from plotly.subplots import make_subplots
 
 st.set_page_config(page_title="군 장병 개인 정보 현황", page_icon="🪖", layout="wide")
 
 
-def decompose_hangul(char: str) -> tuple[int, int, int]:
-    """한글 문자를 초성, 중성, 종성으로 분해"""
-    if not ('가' <= char <= '힣'):
-        # 한글이 아니면 유니코드 값으로 정렬
-        return (999, ord(char), 0)
-    
-    code = ord(char) - ord('가')
-    # 초성: 19개 (ㄱ, ㄲ, ㄴ, ㄷ, ㄸ, ㄹ, ㅁ, ㅂ, ㅃ, ㅅ, ㅆ, ㅇ, ㅈ, ㅉ, ㅊ, ㅋ, ㅌ, ㅍ, ㅎ)
-    cho = code // (21 * 28)
-    # 중성: 21개 (ㅏ, ㅐ, ㅑ, ㅒ, ㅓ, ㅔ, ㅕ, ㅖ, ㅗ, ㅘ, ㅙ, ㅚ, ㅛ, ㅜ, ㅝ, ㅞ, ㅟ, ㅠ, ㅡ, ㅢ, ㅣ)
-    jung = (code // 28) % 21
-    # 종성: 28개
-    jong = code % 28
-    
-    return (cho, jung, jong)
+@st.cache_resource(show_spinner=False)
+def _init_ko_collate() -> bool:
+    """ko_KR 로캘 정렬 설정 (프로세스 전체 상태이므로 프로세스당 한 번만 실행)"""
+    try:
+        locale.setlocale(locale.LC_COLLATE, "ko_KR.UTF-8")
+        return True
+    except locale.Error:
+        return False
+
+
+# ko_KR 로캘이 설치되어 있으면 C로 구현된 로캘 정렬(strxfrm)로 정렬 키 생성
+HAS_KO_COLLATE = _init_ko_collate()
 
 
-def hangul_sort_key(name: str) -> tuple:
-    """이름을 한글 정렬 기준으로 변환"""
-    result = []
-    for char in name:
-        result.append(decompose_hangul(char))
-    return tuple(result)
+def _decompose_hangul(codes: np.ndarray) -> np.ndarray:
+    """코드 포인트 배열을 (초성, 중성, 종성) 행렬로 분해"""
+    # 한글 음절 범위('가' ~ '힣')만 분해하고, 한글이 아니면 유니코드 값으로 정렬
+    mask = (codes >= 0xAC00) & (codes <= 0xD7A3)
+    base = codes - 0xAC00
+    # 초성: 19개, 중성: 21개, 종성: 28개
+    cho = np.where(mask, base // (21 * 28), 999)
+    jung = np.where(mask, (base // 28) % 21, codes)
+    jong = np.where(mask, base % 28, 0)
+    return np.stack([cho, jung, jong], axis=1)
+
+
+def hangul_sort_key(name: str) -> str | bytes:
+    """이름을 한글 정렬 기준(초성, 중성, 종성)으로 비교 가능한 키로 변환"""
+    if HAS_KO_COLLATE:
+        return locale.strxfrm(name)
+    # 로캘이 없으면 직접 분해
+    codes = np.frombuffer(name.encode("utf-32-le"), dtype=np.uint32)
+    # 빅엔디언 고정 폭 정수로 직렬화하면 bytes 비교가 튜플 비교와 같은 순서가 됨
+    return _decompose_hangul(codes).astype(">u4").tobytes()
 
 SIZE_OPTIONS = ["S", "M", "L", "XL", "XXL", "XXXL"]
 ALLERGY_OPTIONS = [
@@ -46,30 +62,71 @@ ALLERGY_OPTIONS = [
     "과일 및 채소: 복숭아",
     "과일 및 채소: 토마토",
 ]
+# 사이즈/알레르기 이름 -> 옵션 목록 내 위치 (레코드에는 이 코드로 저장)
+SIZE_INDEX = {size: i for i, size in enumerate(SIZE_OPTIONS)}
+ALLERGY_INDEX = {allergy: i for i, allergy in enumerate(ALLERGY_OPTIONS)}
+# 사이즈는 int8 코드, 알레르기는 항목당 1비트인 uint16 비트마스크로 저장
+RECORD_DTYPES = {"모자 사이즈": np.int8, "옷 사이즈": np.int8, "_allergy_mask": np.uint16}
+# 원형 그래프 색상 팔레트
+HAT_COLORS = tuple(px.colors.sequential.Blues)
+CLOTH_COLORS = tuple(px.colors.sequential.Greens)
+ALLERGY_COLORS = tuple(px.colors.sequential.Reds)
+
+
+def build_record(name: str, hat_size: str, cloth_size: str, allergies: list[str]) -> dict:
+    """입력값으로 레코드 생성 (정렬 키와 코드는 여기서 한 번만 계산)"""
+    return {
+        "이름": name,
+        "모자 사이즈": SIZE_INDEX[hat_size],
+        "옷 사이즈": SIZE_INDEX[cloth_size],
+        "_allergy_mask": sum(1 << ALLERGY_INDEX[allergy] for allergy in allergies),
+        "_key": hangul_sort_key(name),
+    }
+
+
+def allergy_text(mask: int) -> str:
+    """알레르기 비트마스크를 표시용 문자열로 변환"""
+    allergies = [
+        allergy for i, allergy in enumerate(ALLERGY_OPTIONS) if (mask >> i) & 1
+    ]
+    return ", ".join(allergies) if allergies else "없음"
+
+
+# 목록 프래그먼트는 선택 변경마다 다시 실행되므로, 데이터가 같으면 변환 결과를 재사용
+@st.cache_data(max_entries=4)
+def to_display_df(df: pd.DataFrame) -> pd.DataFrame:
+    """코드로 저장된 레코드를 화면 표시용 표로 변환"""
+    size_labels = np.array(SIZE_OPTIONS)
+    return pd.DataFrame(
+        {
+            "이름": df["이름"],
+            "모자 사이즈": size_labels[df["모자 사이즈"].to_numpy()],
+            "옷 사이즈": size_labels[df["옷 사이즈"].to_numpy()],
+            "식품 알레르기": [allergy_text(int(mask)) for mask in df["_allergy_mask"]],
+        }
+    )
+
+
+def record_label(df: pd.DataFrame, record_id: int) -> str:
+    """삭제 선택/확인에 쓰는 레코드 이름 (동명이인도 구분되도록 사이즈와 ID 포함)"""
+    hat_size = SIZE_OPTIONS[df.at[record_id, "모자 사이즈"]]
+    cloth_size = SIZE_OPTIONS[df.at[record_id, "옷 사이즈"]]
+    return f"{df.at[record_id, '이름']} (모자 {hat_size}/옷 {cloth_size}, #{record_id})"
 
 
 def init_session_state():
-    if "records" not in st.session_state:
-        st.session_state.records = [
-            {
-                "이름": "김민수",
-                "모자 사이즈": "M",
-                "옷 사이즈": "L",
-                "식품 알레르기": "난류: 달걀, 해산물: 갑각류(새우, 게)",
-            },
-            {
-                "이름": "이영희",
-                "모자 사이즈": "S",
-                "옷 사이즈": "M",
-                "식품 알레르기": "견과류: 땅콩, 견과류: 호두",
-            },
-            {
-                "이름": "박철수",
-                "모자 사이즈": "XL",
-                "옷 사이즈": "XL",
-                "식품 알레르기": "해산물: 생선(고등어 등)",
-            },
+    if "df" not in st.session_state:
+        seed = [
+            build_record("김민수", "M", "L", ["난류: 달걀", "해산물: 갑각류(새우, 게)"]),
+            build_record("이영희", "S", "M", ["견과류: 땅콩", "견과류: 호두"]),
+            build_record("박철수", "XL", "XL", ["해산물: 생선(고등어 등)"]),
         ]
+        # 인덱스는 삭제 후에도 바뀌지 않는 레코드 ID, 행은 항상 이름순으로 유지
+        st.session_state.df = pd.DataFrame(seed).astype(RECORD_DTYPES).sort_values("_key")
+        st.session_state.next_id = len(seed)
+    if "pending_delete_id" not in st.session_state:
+        # 삭제 확인 중인 레코드 ID (없으면 None)
+        st.session_state.pending_delete_id = None
 
 
 def add_record(name: str, hat_size: str, cloth_size: str, allergies: list[str]) -> None:
@@ -77,136 +134,146 @@ def add_record(name: str, hat_size: str, cloth_size: str, allergies: list[str])
         st.warning("이름을 입력해주세요.")
         return
 
-    allergy_text = ", ".join(allergies) if allergies else "없음"
-    st.session_state.records.append(
-        {
-            "이름": name,
-            "모자 사이즈": hat_size,
-            "옷 사이즈": cloth_size,
-            "식품 알레르기": allergy_text,
-        }
+    new_record = build_record(name, hat_size, cloth_size, allergies)
+    record_id = st.session_state.next_id
+    st.session_state.next_id += 1
+    # 정렬 순서가 유지되도록 이진 탐색으로 찾은 위치에 삽입
+    df = st.session_state.df
+    pos = df["_key"].searchsorted(new_record["_key"], side="right")
+    st.session_state.df = pd.concat(
+        [
+            df.iloc[:pos],
+            pd.DataFrame([new_record], index=[record_id]).astype(RECORD_DTYPES),
+            df.iloc[pos:],
+        ]
     )
-    st.success(f"{name} 정보를 추가했습니다.")
+    # 목록과 그래프에 반영되도록 앱 전체를 다시 실행 (토스트는 재실행 후에도 표시됨)
+    st.toast(f"{name} 정보를 추가했습니다.")
+    st.rerun(scope="app")
 
 
-def delete_record(index: int) -> None:
-    if 0 <= index < len(st.session_state.records):
-        deleted_name = st.session_state.records[index]["이름"]
-        st.session_state.records.pop(index)
-        st.success(f"{deleted_name} 정보를 삭제했습니다.")
-        st.rerun()
+def delete_record(record_id: int) -> None:
+    if record_id in st.session_state.df.index:
+        deleted_name = st.session_state.df.at[record_id, "이름"]
+        st.session_state.df = st.session_state.df.drop(record_id)
+        # 콜백 안에서는 화면 요소 표시와 st.rerun을 쓸 수 없으므로
+        # 알림과 그래프 갱신은 목록 프래그먼트에 맡김
+        st.session_state.record_deleted = deleted_name
 
 
-def create_charts(records: list[dict]) -> None:
-    """원형 그래프 생성"""
-    if not records:
-        return
+def _confirm_delete(record_id: int) -> None:
+    """삭제 확인 '예' 콜백"""
+    st.session_state.pending_delete_id = None
+    delete_record(record_id)
+
+
+def _cancel_delete() -> None:
+    """삭제 확인 '아니요' 콜백"""
+    st.session_state.pending_delete_id = None
+
+
+def _pie_colors(palette: tuple[str, ...], n: int) -> list[str]:
+    """조각 수만큼만 팔레트 색상을 (모자라면 반복해서) 선택"""
+    return [palette[i % len(palette)] for i in range(n)]
+
+
+# 재사용되는 것은 현재 목록의 스냅샷뿐이므로 최근 몇 개만 보관
+@st.cache_data(max_entries=4)
+def _compute_chart_fig(df: pd.DataFrame) -> go.Figure:
+    """집계 및 원형 그래프 객체 생성 (데이터가 같으면 캐시된 결과 재사용)"""
+    # 사이즈별 인원 수 (SIZE_OPTIONS 순서, 인원이 없는 사이즈는 0)
+    hat_size_counts = np.bincount(df["모자 사이즈"].to_numpy(), minlength=len(SIZE_OPTIONS))
+    cloth_size_counts = np.bincount(df["옷 사이즈"].to_numpy(), minlength=len(SIZE_OPTIONS))
     
-    # 모자 사이즈별 인원 수
-    hat_size_counts = {}
-    for record in records:
-        size = record["모자 사이즈"]
-        hat_size_counts[size] = hat_size_counts.get(size, 0) + 1
+    # 알레르기별 인원 수: (레코드 수 x 알레르기 수) 비트 행렬을 열 방향으로 합산
+    masks = df["_allergy_mask"].to_numpy()
+    bits = np.arange(len(ALLERGY_OPTIONS), dtype=np.uint16)
+    allergy_counts = ((masks[:, None] >> bits) & 1).sum(axis=0, dtype=np.int64)
     
-    # 옷 사이즈별 인원 수
-    cloth_size_counts = {}
-    for record in records:
-        size = record["옷 사이즈"]
-        cloth_size_counts[size] = cloth_size_counts.get(size, 0) + 1
+    # 세 원형 그래프를 하나의 figure에 배치해 한 번에 전송
+    fig = make_subplots(
+        rows=1,
+        cols=3,
+        specs=[[{"type": "domain"}] * 3],
+        subplot_titles=("모자 사이즈별 인원 수", "옷 사이즈별 인원 수", "알레르기별 인원 수"),
+    )
+    
+    # 모자 사이즈 그래프
+    fig.add_trace(
+        go.Pie(
+            labels=SIZE_OPTIONS,
+            values=hat_size_counts.tolist(),
+            name="모자 사이즈",
+            legend="legend",
+            marker_colors=_pie_colors(HAT_COLORS, len(SIZE_OPTIONS)),
+        ),
+        1,
+        1,
+    )
     
-    # 알레르기별 인원 수
-    allergy_counts = {}
-    for record in records:
-        allergies = record["식품 알레르기"]
-        if allergies and allergies != "없음":
-            # 알레르기가 여러 개일 수 있으므로 쉼표로 분리
-            allergy_list = [a.strip() for a in allergies.split(",")]
-            for allergy in allergy_list:
-                allergy_counts[allergy] = allergy_counts.get(allergy, 0) + 1
+    # 옷 사이즈 그래프
+    fig.add_trace(
+        go.Pie(
+            labels=SIZE_OPTIONS,
+            values=cloth_size_counts.tolist(),
+            name="옷 사이즈",
+            legend="legend2",
+            marker_colors=_pie_colors(CLOTH_COLORS, len(SIZE_OPTIONS)),
+        ),
+        1,
+        2,
+    )
     
-    # 그래프 생성
-    col1, col2 = st.columns([1, 1])
+    # 알레르기 그래프 (인원 수 기준 내림차순)
+    if allergy_counts.any():
+        allergy_order = [
+            i for i in np.argsort(-allergy_counts, kind="stable") if allergy_counts[i]
+        ]
+        fig.add_trace(
+            go.Pie(
+                labels=[ALLERGY_OPTIONS[i] for i in allergy_order],
+                values=allergy_counts[allergy_order].tolist(),
+                name="알레르기",
+                legend="legend3",
+                marker_colors=_pie_colors(ALLERGY_COLORS, len(allergy_order)),
+            ),
+            1,
+            3,
+        )
     
-    with col1:
-        # 모자 사이즈 그래프
-        if hat_size_counts:
-            hat_df = pd.DataFrame({
-                "사이즈": list(hat_size_counts.keys()),
-                "인원 수": list(hat_size_counts.values())
-            })
-            # 사이즈 순서대로 정렬
-            size_order = ["S", "M", "L", "XL", "XXL", "XXXL"]
-            hat_df["사이즈"] = pd.Categorical(hat_df["사이즈"], categories=size_order, ordered=True)
-            hat_df = hat_df.sort_values("사이즈")
-            
-            fig_hat = px.pie(
-                hat_df, 
-                values="인원 수",
-                names="사이즈",
-                title="모자 사이즈별 인원 수",
-                color_discrete_sequence=px.colors.sequential.Blues
-            )
-            fig_hat.update_traces(textposition='inside', textinfo='percent+label')
-            fig_hat.update_layout(height=350)
-            st.plotly_chart(fig_hat, use_container_width=True)
-        else:
-            st.info("모자 사이즈 데이터가 없습니다.")
-        
-        # 옷 사이즈 그래프
-        if cloth_size_counts:
-            cloth_df = pd.DataFrame({
-                "사이즈": list(cloth_size_counts.keys()),
-                "인원 수": list(cloth_size_counts.values())
-            })
-            # 사이즈 순서대로 정렬
-            cloth_df["사이즈"] = pd.Categorical(cloth_df["사이즈"], categories=size_order, ordered=True)
-            cloth_df = cloth_df.sort_values("사이즈")
-            
-            fig_cloth = px.pie(
-                cloth_df, 
-                values="인원 수",
-                names="사이즈",
-                title="옷 사이즈별 인원 수",
-                color_discrete_sequence=px.colors.sequential.Greens
-            )
-            fig_cloth.update_traces(textposition='inside', textinfo='percent+label')
-            fig_cloth.update_layout(height=350)
-            st.plotly_chart(fig_cloth, use_container_width=True)
-        else:
-            st.info("옷 사이즈 데이터가 없습니다.")
+    # 이미 정렬된 순서 그대로 그리고, 조각에는 비율만, 호버에는 이름과 인원 수 표시
+    fig.update_traces(
+        sort=False,
+        textposition="inside",
+        texttemplate="%{percent}",
+        hoverinfo="label+value",
+    )
     
-    with col2:
-        # 알레르기 그래프
-        if allergy_counts:
-            allergy_df = pd.DataFrame({
-                "알레르기": list(allergy_counts.keys()),
-                "인원 수": list(allergy_counts.values())
-            })
-            # 인원 수 기준으로 내림차순 정렬
-            allergy_df = allergy_df.sort_values("인원 수", ascending=False)
-            
-            fig_allergy = px.pie(
-                allergy_df, 
-                values="인원 수",
-                names="알레르기",
-                title="알레르기별 인원 수",
-                color_discrete_sequence=px.colors.sequential.Reds
-            )
-            fig_allergy.update_traces(textposition='inside', textinfo='percent+label')
-            fig_allergy.update_layout(height=700)
-            st.plotly_chart(fig_allergy, use_container_width=True)
-        else:
-            st.info("알레르기 정보가 없습니다.")
+    # 모자/옷 그래프의 라벨(S, M, ...)이 겹치므로 그래프마다 범례를 따로 두고 각 그래프 아래에 배치
+    legends = {}
+    for col, legend in enumerate(("legend", "legend2", "legend3"), start=1):
+        x0, x1 = fig.get_subplot(1, col).x
+        legends[legend] = dict(x=(x0 + x1) / 2, xanchor="center", y=-0.05, yanchor="top")
+    fig.update_layout(height=650, margin=dict(l=0, r=0, t=40, b=0), showlegend=True, **legends)
+    return fig
 
 
-def main():
-    init_session_state()
+def create_charts(df: pd.DataFrame) -> None:
+    """원형 그래프 생성"""
+    if df.empty:
+        return
+    
+    fig = _compute_chart_fig(df[["모자 사이즈", "옷 사이즈", "_allergy_mask"]])
+    st.plotly_chart(fig, width="stretch")
+    
+    # 알레르기 그래프는 데이터가 있을 때만 추가됨
+    if len(fig.data) < 3:
+        st.info("알레르기 정보가 없습니다.")
 
-    st.title("군 장병 개인별 사이즈 및 알레르기 현황")
-    st.markdown(
-        "이름과 모자/옷 사이즈, 식품 알레르기를 선택하여 아래 표에 정보를 추가하세요."
-    )
 
+@st.fragment
+def _form_fragment() -> None:
+    """정보 입력 폼 (입력 중에는 이 영역만 다시 실행)"""
     with st.form("personal_info_form", clear_on_submit=True):
         name = st.text_input("이름", placeholder="예: 홍길동")
         col1, col2 = st.columns(2)
@@ -221,62 +288,71 @@ def main():
     if submitted:
         add_record(name, hat_size, cloth_size, allergies)
 
-    st.markdown("---")
+
+@st.fragment
+def _list_fragment() -> None:
+    """등록된 정보 목록과 삭제 UI (선택 변경 시 이 영역만 다시 실행)"""
+    # 삭제 후에는 알림을 띄우고 그래프도 갱신되도록 앱 전체 재실행 (앱 범위 재실행은 어디서나 허용됨)
+    deleted_name = st.session_state.pop("record_deleted", None)
+    if deleted_name is not None:
+        st.toast(f"{deleted_name} 정보를 삭제했습니다.")
+        st.rerun()
+    
     st.subheader("등록된 정보 목록")
     
-    if not st.session_state.records:
+    if st.session_state.df.empty:
         st.info("등록된 정보가 없습니다.")
-    else:
-        # 이름 기준으로 한글 정렬 (자음/모음 순서)
-        sorted_records = sorted(st.session_state.records, key=lambda x: hangul_sort_key(x["이름"]))
-        
-        # 각 행에 삭제 버튼 추가
-        for idx, record in enumerate(sorted_records):
-            with st.container():
-                col1, col2, col3, col4, col5 = st.columns([2, 1, 1, 3, 1])
-                with col1:
-                    st.write(f"**{record['이름']}**")
-                with col2:
-                    st.write(f"모자: {record['모자 사이즈']}")
-                with col3:
-                    st.write(f"옷: {record['옷 사이즈']}")
-                with col4:
-                    st.write(f"알레르기: {record['식품 알레르기']}")
-                with col5:
-                    delete_key = f"delete_{record['이름']}_{idx}"
-                    if st.button("🗑️ 삭제", key=delete_key, type="secondary"):
-                        # 확인 다이얼로그 표시
-                        if st.session_state.get(f"show_confirm_{record['이름']}", False):
-                            st.session_state[f"show_confirm_{record['이름']}"] = False
-                        else:
-                            st.session_state[f"show_confirm_{record['이름']}"] = True
-                        st.rerun()
-                
-                # 확인 다이얼로그 표시
-                if st.session_state.get(f"show_confirm_{record['이름']}", False):
-                    with st.container():
-                        st.warning(f"**{record['이름']}**의 정보를 정말 삭제할까요?")
-                        col_yes, col_no = st.columns(2)
-                        with col_yes:
-                            if st.button("✅ 예", key=f"confirm_yes_{record['이름']}_{idx}", type="primary"):
-                                # 이름으로 원본 records에서 찾아서 삭제
-                                for i, r in enumerate(st.session_state.records):
-                                    if r["이름"] == record["이름"]:
-                                        delete_record(i)
-                                        break
-                                if f"show_confirm_{record['이름']}" in st.session_state:
-                                    del st.session_state[f"show_confirm_{record['이름']}"]
-                        with col_no:
-                            if st.button("❌ 아니요", key=f"confirm_no_{record['이름']}_{idx}"):
-                                st.session_state[f"show_confirm_{record['이름']}"] = False
-                                st.rerun()
-                
-                st.markdown("---")
-        
-        # 그래프 표시
+        return
+    
+    # df는 삽입 시점에 이미 이름 기준 한글 정렬 (자음/모음 순서) 상태
+    sorted_df = st.session_state.df
+    st.dataframe(to_display_df(sorted_df), width="stretch", hide_index=True)
+    
+    # 삭제할 장병 선택 후 확인 메시지 표시
+    target_id = st.selectbox(
+        "삭제할 장병",
+        options=sorted_df.index,
+        format_func=lambda record_id: record_label(sorted_df, record_id),
+    )
+    if st.button("🗑️ 삭제", type="secondary"):
+        st.session_state.pending_delete_id = target_id
+    
+    pending_id = st.session_state.pending_delete_id
+    if pending_id is not None and pending_id not in sorted_df.index:
+        # 확인 대기 중이던 레코드가 이미 사라졌으면 확인 상태도 정리
+        st.session_state.pending_delete_id = pending_id = None
+    if pending_id is not None:
+        # 예/아니요를 하나의 폼으로 묶어 선택 시 한 번만 재실행
+        # (콜백이 재실행 전에 확인 상태를 지우므로 별도의 st.rerun이 필요 없음)
+        with st.form("confirm_delete", clear_on_submit=True):
+            st.warning(f"**{record_label(sorted_df, pending_id)}**의 정보를 정말 삭제할까요?")
+            col_yes, col_no = st.columns(2)
+            with col_yes:
+                st.form_submit_button(
+                    "✅ 예", type="primary", on_click=_confirm_delete, args=(pending_id,)
+                )
+            with col_no:
+                st.form_submit_button("❌ 아니요", on_click=_cancel_delete)
+
+
+def main():
+    init_session_state()
+
+    st.title("군 장병 개인별 사이즈 및 알레르기 현황")
+    st.markdown(
+        "이름과 모자/옷 사이즈, 식품 알레르기를 선택하여 아래 표에 정보를 추가하세요."
+    )
+
+    _form_fragment()
+
+    st.markdown("---")
+    _list_fragment()
+    
+    # 그래프는 프래그먼트 밖에 두어 데이터가 바뀌는 앱 전체 재실행 때만 다시 그림
+    if not st.session_state.df.empty:
         st.markdown("---")
         st.subheader("통계 그래프")
-        create_charts(st.session_state.records)
+        create_charts(st.session_state.df)
 
 
 if __name__ == "__main__":